@@ -47,31 +47,16 @@ def to_weekday(arg: Union[int, str]) -> Weekday:
     return matching[0]
 
 
-_MONTH_LENGTHS = [
-    None,
-    31,
-    (lambda year: 29 if calendar.isleap(year) else 28),
-    31,
-    30,
-    31,
-    30,
-    31,
-    31,
-    30,
-    31,
-    30,
-    31,
-]
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 def month_length(year: int, month: int) -> int:
     """Return the number of days of a given month"""
     if month < 1 or month > 12:
         raise ValueError(f"Invalid month: {month}")
-    mlen = _MONTH_LENGTHS[month]
-    if isinstance(mlen, int):
-        return mlen
-    return mlen(year)
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _MONTH_LENGTHS[month - 1]
 
 
 def day_exists(year: int, month: int, day: int) -> bool:
@@ -152,6 +137,14 @@ def parse_date(arg: Union[str, Tuple[int, int, int]]) -> date:
         if not day_exists(y, m, d):
             raise ValueError(f"Invalid date: {arg!r}")
         return date(y, m, d)
+    if len(arg) == 8 and arg.isascii() and arg.isdigit():
+        # Fast path for YYYYMMDD, avoiding strptime
+        y = int(arg[:4])
+        m = int(arg[4:6])
+        d = int(arg[6:])
+        if y < 1 or not day_exists(y, m, d):
+            raise ValueError(f"Unrecognised date format: {arg!r}")
+        return date(y, m, d)
     try_formats = ["%Y%m%d"]
     dt = None
     for fmt in try_formats:
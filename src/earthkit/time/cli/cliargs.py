@@ -95,7 +95,7 @@ def create_sequence(
     try:
         if args.daily:
             try:
-                excludes = [int(elem) for elem in args.exclude]
+                excludes = {int(elem) for elem in args.exclude}
             except ValueError as e:
                 raise ValueError(
                     "Invalid excludes, must be a slash-separated list of days"
@@ -104,10 +104,10 @@ def create_sequence(
         elif args.weekly is not None:
             seq = WeeklySequence(args.weekly)
         elif args.monthly is not None:
-            excludes = [parse_mmdd(elem) for elem in args.exclude]
+            excludes = {parse_mmdd(elem) for elem in args.exclude}
             seq = MonthlySequence(args.monthly, excludes=excludes)
         elif args.yearly is not None:
-            excludes = [parse_date(elem) for elem in args.exclude]
+            excludes = {parse_date(elem) for elem in args.exclude}
             seq = YearlySequence(args.yearly, excludes=excludes)
         elif args.preset is not None:
             seq = Sequence.from_resource(args.preset)
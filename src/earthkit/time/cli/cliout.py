@@ -3,8 +3,8 @@ from typing import Iterable
 
 
 def format_date(d: date) -> str:
-    return d.strftime("%Y%m%d")
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
 
 
 def format_date_list(dates: Iterable[date], sep: str = "/") -> str:
-    return sep.join(format_date(d) for d in dates)
+    return sep.join([format_date(d) for d in dates])
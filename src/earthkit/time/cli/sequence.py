@@ -13,54 +13,76 @@ from .cliargs import (
 from .cliout import format_date, format_date_list
 
 
-def seq_next_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+def _seq_next_compute(parser: argparse.ArgumentParser, args: argparse.Namespace) -> str:
     seq = create_sequence(parser, args)
     new = seq.next(args.date, strict=(not args.inclusive))
     for _ in range(args.skip):
         new = seq.next(new, strict=True)
-    print(format_date(new))
+    return format_date(new)
 
 
-def seq_prev_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+def seq_next_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    print(_seq_next_compute(parser, args))
+
+
+def _seq_prev_compute(parser: argparse.ArgumentParser, args: argparse.Namespace) -> str:
     seq = create_sequence(parser, args)
     new = seq.previous(args.date, strict=(not args.inclusive))
     for _ in range(args.skip):
         new = seq.previous(new, strict=True)
-    print(format_date(new))
+    return format_date(new)
 
 
-def seq_nearest_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+def seq_prev_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    print(_seq_prev_compute(parser, args))
+
+
+def _seq_nearest_compute(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> str:
     seq = create_sequence(parser, args)
-    print(format_date(seq.nearest(args.date, resolve=args.resolve)))
+    return format_date(seq.nearest(args.date, resolve=args.resolve))
 
 
-def seq_range_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+def seq_nearest_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    print(_seq_nearest_compute(parser, args))
+
+
+def _seq_range_compute(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> str:
     seq = create_sequence(parser, args)
-    print(
-        format_date_list(
-            seq.range(
-                getattr(args, "from"),
-                args.to,
-                (not args.exclude_start),
-                (not args.exclude_end),
-            ),
-            sep=args.sep,
-        )
+    return format_date_list(
+        seq.range(
+            getattr(args, "from"),
+            args.to,
+            (not args.exclude_start),
+            (not args.exclude_end),
+        ),
+        sep=args.sep,
     )
 
 
-def seq_bracket_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+def seq_range_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    print(_seq_range_compute(parser, args))
+
+
+def _seq_bracket_compute(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> str:
     num = args.before
     if args.after is not None:
         num = (args.before, args.after)
     seq = create_sequence(parser, args)
-    print(
-        format_date_list(
-            seq.bracket(args.date, num, strict=(not args.inclusive)), sep=args.sep
-        )
+    return format_date_list(
+        seq.bracket(args.date, num, strict=(not args.inclusive)), sep=args.sep
     )
 
 
+def seq_bracket_action(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    print(_seq_bracket_compute(parser, args))
+
+
 def get_parser() -> argparse.ArgumentParser:
     parser = ActionParser(
         description="Manipulate sequences of dates", fromfile_prefix_chars="@"
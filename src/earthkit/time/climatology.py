@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Iterator, Union
 
-from .sequence import Sequence, YearlySequence
+from .sequence import Sequence
 from .utilities import merge_sorted
 
 
@@ -84,8 +84,18 @@ def date_range(
         if not isinstance(end, date):
             end = reference.replace(year=end)
 
-        seq = YearlySequence((reference.month, reference.day))
-        yield from seq.range(start, end, include_end=include_endpoint)
+        if end < start:
+            raise ValueError("Start date should be before end date")
+
+        first = start.year
+        if reference.replace(year=first) < start:
+            first += 1
+        last = end.year
+        last_date = reference.replace(year=last)
+        if last_date > end or (last_date == end and not include_endpoint):
+            last -= 1
+        for year in range(first, last + 1):
+            yield reference.replace(year=year)
 
 
 def model_climate_dates(
@@ -1,7 +1,19 @@
+import bisect
 import os.path
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import date, timedelta
-from typing import Container, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+from typing import (
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .calendar import (
     MonthInYear,
@@ -86,8 +98,7 @@ class Sequence(ABC):
             raise ValueError("Start date should be before end date")
 
         current = self.next(start, strict=(not include_start))
-        last = self.previous(end, strict=(not include_end))
-        while current <= last:
+        while current < end or (include_end and current == end):
             yield current
             current = self.next(current)
 
@@ -115,17 +126,19 @@ class Sequence(ABC):
         if before <= 0 or after <= 0:
             raise ValueError("`num` values must be positive")
 
-        start = reference
+        preceding = []
+        current = reference
         for _ in range(before):
-            start = self.previous(start)
+            current = self.previous(current)
+            preceding.append(current)
+        yield from reversed(preceding)
 
-        end = reference
-        for _ in range(after):
-            end = self.next(end)
+        if not strict and reference in self:
+            yield reference
 
-        for current in self.range(start, end):
-            if strict and current == reference:
-                continue
+        current = reference
+        for _ in range(after):
+            current = self.next(current)
             yield current
 
     @classmethod
@@ -193,6 +206,22 @@ class Sequence(ABC):
         return cls.from_dict(seq_dict)
 
 
+def _freeze_excludes(excludes: Container) -> Container:
+    """Convert plain collections of excluded values to a :class:`frozenset`
+
+    Other containers (e.g. :class:`range` or objects implementing
+    ``__contains__``) are returned unchanged. The result is a snapshot:
+    in-place changes to ``excludes`` are not reflected, the ``excludes``
+    attribute of the sequence must be reassigned instead.
+    """
+    if isinstance(excludes, (list, tuple, set)):
+        try:
+            return frozenset(excludes)
+        except TypeError:
+            pass
+    return excludes
+
+
 class DailySequence(Sequence, seqname="daily"):
     """Sequence of consecutive dates
 
@@ -207,12 +236,41 @@ class DailySequence(Sequence, seqname="daily"):
     def __init__(self, excludes: Container[int] = set()):
         self.excludes = excludes
 
+    @property
+    def excludes(self) -> Container[int]:
+        """Excluded days of the month"""
+        return self._excludes_orig
+
+    @excludes.setter
+    def excludes(self, excludes: Container[int]):
+        self._excludes_orig = excludes
+        self._excludes = _freeze_excludes(excludes)
+
     def __contains__(self, reference: date) -> bool:
-        return reference.day not in self.excludes
+        return reference.day not in self._excludes
 
     def __repr__(self) -> str:
         return f"DailySequence(excludes={self.excludes!r})"
 
+    def range(
+        self,
+        start: date,
+        end: date,
+        include_start: bool = True,
+        include_end: bool = True,
+    ) -> Iterator[date]:
+        if end < start:
+            raise ValueError("Start date should be before end date")
+
+        oneday = timedelta(days=1)
+        current = start if include_start else start + oneday
+        last = end if include_end else end - oneday
+        excludes = self._excludes
+        while current <= last:
+            if current.day not in excludes:
+                yield current
+            current += oneday
+
     @classmethod
     def _from_dict(cls, seq_dict: dict) -> Sequence:
         return cls(excludes=set(seq_dict.get("excludes", set())))
@@ -230,44 +288,52 @@ class WeeklySequence(Sequence, seqname="weekly"):
     """
 
     def __init__(self, days: Union[int, Weekday, Iterable[int], Iterable[Weekday]]):
+        self.days = days
+
+    @property
+    def days(self) -> List[Weekday]:
+        """Sorted days of the week"""
+        return self._days
+
+    @days.setter
+    def days(self, days: Union[int, Weekday, Iterable[int], Iterable[Weekday]]):
         if isinstance(days, (int, Weekday)):
-            self.days = [Weekday(days)]
+            days = [Weekday(days)]
         else:
-            self.days = sorted(Weekday(day) for day in days)
-        if not self.days:
+            days = sorted(Weekday(day) for day in days)
+        if not days:
             raise ValueError("`days` cannot be empty")
+        self._days = days
+        self._mask = 0
+        for day in days:
+            self._mask |= 1 << day
+        # Distance in days to the next (resp. previous) matching week day,
+        # in 1-7, indexed by the week day of the reference
+        self._next_offsets = tuple(
+            min((day - wday - 1) % 7 + 1 for day in days) for wday in range(7)
+        )
+        self._prev_offsets = tuple(
+            min((wday - day - 1) % 7 + 1 for day in days) for wday in range(7)
+        )
 
     def __contains__(self, reference: date) -> bool:
-        wday = Weekday(reference.weekday())
-        return wday in self.days
+        return bool((self._mask >> reference.weekday()) & 1)
 
     def __repr__(self) -> str:
         repr_days = ", ".join([day.name for day in self.days])
         return f"WeeklySequence(days=[{repr_days}])"
 
     def next(self, reference: date, strict: bool = True) -> date:
-        wday = Weekday(reference.weekday())
-        if wday in self.days and not strict:
+        wday = reference.weekday()
+        if not strict and (self._mask >> wday) & 1:
             return reference
-        new_wday = next((day for day in self.days if day > wday), self.days[0])
-        delta = new_wday - wday
-        assert -7 < delta < 7
-        if delta > 0:
-            return reference + timedelta(days=delta)
-        else:
-            return reference + timedelta(days=(delta + 7))
+        return reference + timedelta(days=self._next_offsets[wday])
 
     def previous(self, reference: date, strict: bool = True) -> date:
-        wday = Weekday(reference.weekday())
-        if wday in self.days and not strict:
+        wday = reference.weekday()
+        if not strict and (self._mask >> wday) & 1:
             return reference
-        new_wday = next((day for day in self.days[::-1] if day < wday), self.days[-1])
-        delta = new_wday - wday
-        assert -7 < delta < 7
-        if delta < 0:
-            return reference + timedelta(days=delta)
-        else:
-            return reference + timedelta(days=(delta - 7))
+        return reference - timedelta(days=self._prev_offsets[wday])
 
     @classmethod
     def _from_dict(cls, seq_dict: dict) -> Sequence:
@@ -299,67 +365,86 @@ class MonthlySequence(Sequence, seqname="monthly"):
         days: Union[int, Iterable[int]],
         excludes: Container[Tuple[int, int]] = set(),
     ):
+        self.days = days
+        self.excludes = excludes
+
+    @property
+    def days(self) -> List[int]:
+        """Sorted days of the month"""
+        return self._days
+
+    @days.setter
+    def days(self, days: Union[int, Iterable[int]]):
         if isinstance(days, int):
-            self.days = [days]
+            days = [days]
         else:
-            self.days = sorted(days)
-        if not self.days:
+            days = sorted(days)
+        if not days:
             raise ValueError("`days` cannot be empty")
-        if any((day < 1 or day > 31) for day in self.days):
+        if any((day < 1 or day > 31) for day in days):
             raise ValueError("All days must be between 1 and 31")
-        self.excludes = excludes
+        self._days = days
+        self._mask = 0
+        for day in days:
+            self._mask |= 1 << day
+
+    @property
+    def excludes(self) -> Container[Tuple[int, int]]:
+        """Excluded (month, day) pairs"""
+        return self._excludes_orig
+
+    @excludes.setter
+    def excludes(self, excludes: Container[Tuple[int, int]]):
+        self._excludes_orig = excludes
+        self._excludes = _freeze_excludes(excludes)
 
     def __contains__(self, reference: date) -> bool:
         return (
-            reference.day in self.days
-            and (reference.month, reference.day) not in self.excludes
+            bool((self._mask >> reference.day) & 1)
+            and (reference.month, reference.day) not in self._excludes
         )
 
     def __repr__(self) -> str:
         return f"MonthlySequence(days={self.days!r}, excludes={self.excludes!r})"
 
+    def _first_day(self, ymonth: MonthInYear, start: int) -> Optional[int]:
+        """Return the first valid day of ``ymonth`` not before ``start``, if any"""
+        length = ymonth.length()
+        for i in range(bisect.bisect_left(self._days, start), len(self._days)):
+            day = self._days[i]
+            if day > length:
+                return None
+            if (ymonth.month, day) not in self._excludes:
+                return day
+        return None
+
+    def _last_day(self, ymonth: MonthInYear, end: int) -> Optional[int]:
+        """Return the last valid day of ``ymonth`` not after ``end``, if any"""
+        end = min(end, ymonth.length())
+        for i in range(bisect.bisect_right(self._days, end) - 1, -1, -1):
+            day = self._days[i]
+            if (ymonth.month, day) not in self._excludes:
+                return day
+        return None
+
     def next(self, reference: date, strict: bool = True) -> date:
         if not strict and reference in self:
             return reference
         ymonth = MonthInYear(reference.year, reference.month)
-        new_day = next(
-            (
-                day
-                for day in self.days
-                if day > reference.day
-                and day in ymonth
-                and (ymonth.month, day) not in self.excludes
-            ),
-            None,
-        )
+        new_day = self._first_day(ymonth, reference.day + 1)
         while new_day is None:
             ymonth = ymonth.next()
-            for day in self.days:
-                if day in ymonth and (ymonth.month, day) not in self.excludes:
-                    new_day = day
-                    break
+            new_day = self._first_day(ymonth, 1)
         return date(ymonth.year, ymonth.month, new_day)
 
     def previous(self, reference: date, strict: bool = True) -> date:
         if not strict and reference in self:
             return reference
         ymonth = MonthInYear(reference.year, reference.month)
-        new_day = next(
-            (
-                day
-                for day in self.days[::-1]
-                if day < reference.day
-                and day in ymonth
-                and (ymonth.month, day) not in self.excludes
-            ),
-            None,
-        )
+        new_day = self._last_day(ymonth, reference.day - 1)
         while new_day is None:
             ymonth = ymonth.previous()
-            for day in self.days[::-1]:
-                if day in ymonth and (ymonth.month, day) not in self.excludes:
-                    new_day = day
-                    break
+            new_day = self._last_day(ymonth, 31)
         return date(ymonth.year, ymonth.month, new_day)
 
     @classmethod
@@ -382,83 +467,98 @@ class YearlySequence(Sequence, seqname="yearly"):
       either in "YYYYMMDD" or in (year, month, day) form
     """
 
+    _YEAR_CACHE_SIZE = 128
+
     def __init__(
         self,
         days: Union[Tuple[int, int], Iterable[Tuple[int, int]]],
         excludes: Container[date] = set(),
     ):
+        # Per-year dates, computed on demand for the most recently used years
+        self._year_cache: "OrderedDict[int, List[date]]" = OrderedDict()
+        self.days = days
+        self.excludes = excludes
+
+    @property
+    def days(self) -> List[Tuple[int, int]]:
+        """Sorted days of the year, as (month, day) pairs"""
+        return self._days
+
+    @days.setter
+    def days(self, days: Union[Tuple[int, int], Iterable[Tuple[int, int]]]):
         if (
             isinstance(days, tuple)
             and len(days) == 2
             and all(isinstance(day, int) for day in days)
         ):
-            self.days = [days]
+            self._days = [days]
         else:
-            self.days = sorted(days)
-        self.excludes = excludes
+            self._days = sorted(days)
+        self._year_cache.clear()
+
+    @property
+    def excludes(self) -> Container[date]:
+        """Excluded dates"""
+        return self._excludes_orig
+
+    @excludes.setter
+    def excludes(self, excludes: Container[date]):
+        self._excludes_orig = excludes
+        self._excludes = _freeze_excludes(excludes)
+        self._year_cache.clear()
 
     def __contains__(self, reference: date) -> bool:
         return (
             reference.month,
             reference.day,
-        ) in self.days and reference not in self.excludes
+        ) in self.days and reference not in self._excludes
 
     def __repr__(self) -> str:
         return f"YearlySequence(days={self.days!r}, excludes={self.excludes!r})"
 
+    def _dates_in_year(self, year: int) -> List[date]:
+        """Return the sorted dates of the sequence within ``year``"""
+        dates = self._year_cache.get(year)
+        if dates is not None:
+            self._year_cache.move_to_end(year)
+            return dates
+        dates = []
+        for month, day in self._days:
+            if not day_exists(year, month, day):
+                continue
+            current = date(year, month, day)
+            if current not in self._excludes:
+                dates.append(current)
+        self._year_cache[year] = dates
+        if len(self._year_cache) > self._YEAR_CACHE_SIZE:
+            self._year_cache.popitem(last=False)
+        return dates
+
     def next(self, reference: date, strict: bool = True) -> date:
         if not strict and reference in self:
             return reference
 
         year = reference.year
-        new_month, new_day = next(
-            (
-                (month, day)
-                for month, day in self.days
-                if day_exists(year, month, day)
-                and (month, day) > (reference.month, reference.day)
-                and date(year, month, day) not in self.excludes
-            ),
-            (None, None),
-        )
-        while new_day is None:
+        dates = self._dates_in_year(year)
+        i = bisect.bisect_right(dates, reference)
+        while i == len(dates):
             year += 1
-            for month, day in self.days:
-                if (
-                    day_exists(year, month, day)
-                    and date(year, month, day) not in self.excludes
-                ):
-                    new_month = month
-                    new_day = day
-                    break
-        return date(year, new_month, new_day)
+            dates = self._dates_in_year(year)
+            i = 0
+        return dates[i]
 
     def previous(self, reference: date, strict: bool = True) -> date:
         if not strict and reference in self:
             return reference
 
         year = reference.year
-        new_month, new_day = next(
-            (
-                (month, day)
-                for month, day in self.days[::-1]
-                if day_exists(year, month, day)
-                and (month, day) < (reference.month, reference.day)
-                and date(year, month, day) not in self.excludes
-            ),
-            (None, None),
-        )
-        while new_day is None:
+        dates = self._dates_in_year(year)
+        i = bisect.bisect_left(dates, reference)
+        while i == 0:
             year -= 1
-            for month, day in self.days[::-1]:
-                if (
-                    day_exists(year, month, day)
-                    and date(year, month, day) not in self.excludes
-                ):
-                    new_month = month
-                    new_day = day
-                    break
-        return date(year, new_month, new_day)
+            dates = self._dates_in_year(year)
+            i = len(dates)
+        return dates[i - 1]
 
     @classmethod
     def _from_dict(cls, seq_dict: dict) -> Sequence:
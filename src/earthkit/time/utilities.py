@@ -24,6 +24,6 @@ def merge_sorted(its: Iterable[Iterable[T]]) -> Iterator[T]:
             return
         yield items[pick]
         items[pick] = None
-        for i in to_del:
+        for i in sorted(to_del, reverse=True):
             del items[i]
             del its[i]
@@ -8,6 +8,52 @@ from earthkit.time.calendar import Weekday
 from earthkit.time.cli.climatology import date_range_action, model_climate_action
 from earthkit.time.climatology import RelativeYear
 
+MCLIM_DEFAULTS = {
+    "daily": False,
+    "weekly": None,
+    "monthly": None,
+    "yearly": None,
+    "preset": None,
+    "exclude": [],
+    "sep": "\n",
+}
+
+MCLIM_WEEKLY_EXPECTED = "\n".join(
+    f"{y}{m:02d}{d:02d}"
+    for y in range(2020, 2024)
+    for m, d in [(5, 16), (5, 20), (5, 23), (5, 27)]
+)
+MCLIM_MONTHLY_EXPECTED = "\n".join(
+    f"{y}{m:02d}{d:02d}"
+    for y in range(2016, 2018)
+    for m, d in [(6, 25), (6, 29), (7, 1), (7, 5), (7, 9)]
+)
+MCLIM_MONTHLY_EXCLUDE_EXPECTED = "\n".join(
+    f"{y}{m:02d}{d:02d}"
+    for y in range(2012, 2015)
+    for m, d in [(2, 25), (3, 1), (3, 5)]
+)
+MCLIM_WEEKLY_SEP_EXPECTED = "/".join(
+    f"{y}{m:02d}{d:02d}"
+    for y in range(2014, 2017)
+    for m, d in [
+        (3, 29),
+        (4, 5),
+        (4, 12),
+        (4, 19),
+    ]
+)
+MCLIM_PRESET_REL_EXPECTED = "/".join(
+    f"{y + (1 if m == 1 else 0)}{m:02d}{d:02d}"
+    for y in range(2009, 2014)
+    for m, d in [(12, 26), (12, 30), (1, 2), (1, 6)]
+)
+
+
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    return argparse.ArgumentParser()
+
 
 @pytest.mark.parametrize(
     "ref, start, end, sep, expected",
@@ -48,9 +94,9 @@ def test_date_range_action(
     end: Union[date, int, RelativeYear],
     sep: Optional[str],
     expected: str,
+    parser: argparse.ArgumentParser,
     capsys: pytest.CaptureFixture[str],
 ):
-    parser = argparse.ArgumentParser()
     args = argparse.Namespace(
         date=ref,
         start=start,
@@ -74,11 +120,7 @@ def test_date_range_action(
                 "after": 7,
                 "weekly": [Weekday.MONDAY, Weekday.THURSDAY],
             },
-            "\n".join(
-                f"{y}{m:02d}{d:02d}"
-                for y in range(2020, 2024)
-                for m, d in [(5, 16), (5, 20), (5, 23), (5, 27)]
-            ),
+            MCLIM_WEEKLY_EXPECTED,
             id="weekly",
         ),
         pytest.param(
@@ -90,11 +132,7 @@ def test_date_range_action(
                 "after": 9,
                 "monthly": [1, 5, 9, 13, 17, 21, 25, 29],
             },
-            "\n".join(
-                f"{y}{m:02d}{d:02d}"
-                for y in range(2016, 2018)
-                for m, d in [(6, 25), (6, 29), (7, 1), (7, 5), (7, 9)]
-            ),
+            MCLIM_MONTHLY_EXPECTED,
             id="monthly",
         ),
         pytest.param(
@@ -107,11 +145,7 @@ def test_date_range_action(
                 "monthly": [1, 5, 9, 13, 17, 21, 25, 29],
                 "exclude": ["0229"],
             },
-            "\n".join(
-                f"{y}{m:02d}{d:02d}"
-                for y in range(2012, 2015)
-                for m, d in [(2, 25), (3, 1), (3, 5)]
-            ),
+            MCLIM_MONTHLY_EXCLUDE_EXPECTED,
             id="monthly-exclude",
         ),
         pytest.param(
@@ -124,16 +158,7 @@ def test_date_range_action(
                 "weekly": [Weekday.WEDNESDAY],
                 "sep": "/",
             },
-            "/".join(
-                f"{y}{m:02d}{d:02d}"
-                for y in range(2014, 2017)
-                for m, d in [
-                    (3, 29),
-                    (4, 5),
-                    (4, 12),
-                    (4, 19),
-                ]
-            ),
+            MCLIM_WEEKLY_SEP_EXPECTED,
             id="weekly-sep",
         ),
         pytest.param(
@@ -146,27 +171,18 @@ def test_date_range_action(
                 "preset": "ecmwf-mon-thu",
                 "sep": "/",
             },
-            "/".join(
-                f"{y + (1 if m == 1 else 0)}{m:02d}{d:02d}"
-                for y in range(2009, 2014)
-                for m, d in [(12, 26), (12, 30), (1, 2), (1, 6)]
-            ),
+            MCLIM_PRESET_REL_EXPECTED,
             id="preset-rel",
         ),
     ],
 )
 def test_model_climate_action(
-    args: dict, expected: str, capsys: pytest.CaptureFixture[str]
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+    capsys: pytest.CaptureFixture[str],
 ):
-    parser = argparse.ArgumentParser()
-    args.setdefault("daily", False)
-    args.setdefault("weekly", None)
-    args.setdefault("monthly", None)
-    args.setdefault("yearly", None)
-    args.setdefault("preset", None)
-    args.setdefault("exclude", [])
-    args.setdefault("sep", "\n")
-    args = argparse.Namespace(**args)
-    model_climate_action(parser, args)
+    ns = argparse.Namespace(**{**MCLIM_DEFAULTS, **args})
+    model_climate_action(parser, ns)
     captured = capsys.readouterr()
     assert captured.out == expected + "\n"
@@ -7,7 +7,13 @@ from earthkit.time.cli.cliout import format_date, format_date_list
 
 
 @pytest.mark.parametrize(
-    "ymd, expected", [((1999, 11, 22), "19991122"), ((2000, 1, 3), "20000103")]
+    "ymd, expected",
+    [
+        ((1999, 11, 22), "19991122"),
+        ((2000, 1, 3), "20000103"),
+        ((999, 1, 1), "09990101"),
+        ((5, 6, 7), "00050607"),
+    ],
 )
 def test_format_date(ymd: Tuple[int, int, int], expected: str):
     assert format_date(date(*ymd)) == expected
@@ -1,10 +1,16 @@
 import argparse
 from datetime import date
+from typing import Callable
 
 import pytest
 
-from earthkit.time.calendar import Weekday
+from earthkit.time.calendar import Weekday, day_exists
 from earthkit.time.cli.sequence import (
+    _seq_bracket_compute,
+    _seq_nearest_compute,
+    _seq_next_compute,
+    _seq_prev_compute,
+    _seq_range_compute,
     seq_bracket_action,
     seq_nearest_action,
     seq_next_action,
@@ -12,6 +18,73 @@ from earthkit.time.cli.sequence import (
     seq_range_action,
 )
 
+SEQ_DEFAULTS = {
+    "daily": False,
+    "weekly": None,
+    "monthly": None,
+    "yearly": None,
+    "exclude": [],
+}
+SEQ_NEXT_DEFAULTS = {**SEQ_DEFAULTS, "inclusive": False, "skip": 0}
+SEQ_NEAREST_DEFAULTS = {**SEQ_DEFAULTS, "resolve": "previous"}
+SEQ_RANGE_DEFAULTS = {
+    **SEQ_DEFAULTS,
+    "exclude_start": False,
+    "exclude_end": False,
+    "sep": "\n",
+}
+SEQ_BRACKET_DEFAULTS = {
+    **SEQ_DEFAULTS,
+    "before": 1,
+    "after": None,
+    "inclusive": False,
+    "sep": "\n",
+}
+
+SEQ_RANGE_DAILY_EXPECTED = "\n".join(f"200803{d:02d}" for d in range(12, 21))
+SEQ_RANGE_WEEKLY_NOSTART_EXPECTED = "\n".join(
+    f"2010{m:02d}{d:02d}"
+    for m, d in [(9, 12), (9, 19), (9, 26), (10, 3), (10, 10), (10, 17)]
+)
+SEQ_RANGE_MONTHLY_NOEND_EXPECTED = "\n".join(
+    f"2012{m:02d}{d:02d}"
+    for m, d in [
+        (7, 10),
+        (7, 12),
+        (8, 10),
+        (8, 12),
+        (9, 10),
+        (9, 12),
+        (10, 10),
+    ]
+)
+SEQ_RANGE_YEARLY_NOSTART_NOEND_EXPECTED = "\n".join(
+    f"{y:04d}{m:02d}{d:02d}" for y, m, d in [(2014, 1, 15), (2014, 7, 20)]
+)
+SEQ_RANGE_DAILY_SEP_EXPECTED = " ".join(
+    f"{y:04d}{m:02d}{d:02d}"
+    for y, m, d in [
+        (2016, 11, 2),
+        (2016, 11, 3),
+        (2016, 11, 4),
+        (2016, 11, 5),
+        (2016, 11, 6),
+    ]
+)
+SEQ_BRACKET_WEEKLY_2_EXPECTED = "\n".join(
+    f"2016{m:02d}{d:02d}" for m, d in [(9, 28), (10, 1), (10, 5), (10, 8)]
+)
+SEQ_BRACKET_MONTHLY_2_1_EXPECTED = "\n".join(f"2017{m:02d}14" for m in [5, 6, 8])
+SEQ_BRACKET_YEARLY_1_2_INC_EXPECTED = "\n".join(
+    f"{y:04d}{m:02d}{d:02d}"
+    for y, m, d in [(2019, 2, 2), (2019, 3, 3), (2019, 4, 4), (2020, 1, 1)]
+)
+
+
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    return argparse.ArgumentParser()
+
 
 @pytest.mark.parametrize(
     "args, expected",
@@ -48,6 +121,20 @@ from earthkit.time.cli.sequence import (
             "20030228",
             id="yearly-excludes-inc",
         ),
+        pytest.param(
+            {
+                "monthly": list(range(1, 32)),
+                "exclude": [
+                    f"{m:02d}{d:02d}"
+                    for m in range(1, 13)
+                    for d in range(1, 32)
+                    if day_exists(2000, m, d) and (m, d) != (3, 15)
+                ],
+                "date": date(2007, 1, 1),
+            },
+            "20070315",
+            id="monthly-excludes-many",
+        ),
         pytest.param(
             {"monthly": [5, 20], "skip": 2, "date": date(2007, 4, 3)},
             "20070505",
@@ -70,19 +157,13 @@ from earthkit.time.cli.sequence import (
         ),
     ],
 )
-def test_seq_next(args: dict, expected: str, capsys: pytest.CaptureFixture[str]):
-    parser = argparse.ArgumentParser()
-    args.setdefault("daily", False)
-    args.setdefault("weekly", None)
-    args.setdefault("monthly", None)
-    args.setdefault("yearly", None)
-    args.setdefault("exclude", [])
-    args.setdefault("inclusive", False)
-    args.setdefault("skip", 0)
-    args = argparse.Namespace(**args)
-    seq_next_action(parser, args)
-    captured = capsys.readouterr()
-    assert captured.out == expected + "\n"
+def test_seq_next(
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+):
+    ns = argparse.Namespace(**{**SEQ_NEXT_DEFAULTS, **args})
+    assert _seq_next_compute(parser, ns) == expected
 
 
 @pytest.mark.parametrize(
@@ -132,19 +213,13 @@ def test_seq_next(args: dict, expected: str, capsys: pytest.CaptureFixture[str])
         ),
     ],
 )
-def test_seq_prev(args: dict, expected: str, capsys: pytest.CaptureFixture[str]):
-    parser = argparse.ArgumentParser()
-    args.setdefault("daily", False)
-    args.setdefault("weekly", None)
-    args.setdefault("monthly", None)
-    args.setdefault("yearly", None)
-    args.setdefault("exclude", [])
-    args.setdefault("inclusive", False)
-    args.setdefault("skip", 0)
-    args = argparse.Namespace(**args)
-    seq_prev_action(parser, args)
-    captured = capsys.readouterr()
-    assert captured.out == expected + "\n"
+def test_seq_prev(
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+):
+    ns = argparse.Namespace(**{**SEQ_NEXT_DEFAULTS, **args})
+    assert _seq_prev_compute(parser, ns) == expected
 
 
 @pytest.mark.parametrize(
@@ -183,18 +258,13 @@ def test_seq_prev(args: dict, expected: str, capsys: pytest.CaptureFixture[str])
         ),
     ],
 )
-def test_seq_nearest(args: dict, expected: str, capsys: pytest.CaptureFixture[str]):
-    parser = argparse.ArgumentParser()
-    args.setdefault("daily", False)
-    args.setdefault("weekly", None)
-    args.setdefault("monthly", None)
-    args.setdefault("yearly", None)
-    args.setdefault("exclude", [])
-    args.setdefault("resolve", "previous")
-    args = argparse.Namespace(**args)
-    seq_nearest_action(parser, args)
-    captured = capsys.readouterr()
-    assert captured.out == expected + "\n"
+def test_seq_nearest(
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+):
+    ns = argparse.Namespace(**{**SEQ_NEAREST_DEFAULTS, **args})
+    assert _seq_nearest_compute(parser, ns) == expected
 
 
 @pytest.mark.parametrize(
@@ -202,7 +272,7 @@ def test_seq_nearest(args: dict, expected: str, capsys: pytest.CaptureFixture[st
     [
         pytest.param(
             {"daily": True, "from": date(2008, 3, 12), "to": date(2008, 3, 20)},
-            "\n".join(f"200803{d:02d}" for d in range(12, 21)),
+            SEQ_RANGE_DAILY_EXPECTED,
             id="daily",
         ),
         pytest.param(
@@ -212,10 +282,7 @@ def test_seq_nearest(args: dict, expected: str, capsys: pytest.CaptureFixture[st
                 "to": date(2010, 10, 17),
                 "exclude_start": True,
             },
-            "\n".join(
-                f"2010{m:02d}{d:02d}"
-                for m, d in [(9, 12), (9, 19), (9, 26), (10, 3), (10, 10), (10, 17)]
-            ),
+            SEQ_RANGE_WEEKLY_NOSTART_EXPECTED,
             id="weekly-nostart",
         ),
         pytest.param(
@@ -225,18 +292,7 @@ def test_seq_nearest(args: dict, expected: str, capsys: pytest.CaptureFixture[st
                 "to": date(2012, 10, 12),
                 "exclude_end": True,
             },
-            "\n".join(
-                f"2012{m:02d}{d:02d}"
-                for m, d in [
-                    (7, 10),
-                    (7, 12),
-                    (8, 10),
-                    (8, 12),
-                    (9, 10),
-                    (9, 12),
-                    (10, 10),
-                ]
-            ),
+            SEQ_RANGE_MONTHLY_NOEND_EXPECTED,
             id="monthly-noend",
         ),
         pytest.param(
@@ -247,9 +303,7 @@ def test_seq_nearest(args: dict, expected: str, capsys: pytest.CaptureFixture[st
                 "exclude_start": True,
                 "exclude_end": True,
             },
-            "\n".join(
-                f"{y:04d}{m:02d}{d:02d}" for y, m, d in [(2014, 1, 15), (2014, 7, 20)]
-            ),
+            SEQ_RANGE_YEARLY_NOSTART_NOEND_EXPECTED,
             id="yearly-nostart-noend",
         ),
         pytest.param(
@@ -259,34 +313,18 @@ def test_seq_nearest(args: dict, expected: str, capsys: pytest.CaptureFixture[st
                 "to": date(2016, 11, 6),
                 "sep": " ",
             },
-            " ".join(
-                f"{y:04d}{m:02d}{d:02d}"
-                for y, m, d in [
-                    (2016, 11, 2),
-                    (2016, 11, 3),
-                    (2016, 11, 4),
-                    (2016, 11, 5),
-                    (2016, 11, 6),
-                ]
-            ),
+            SEQ_RANGE_DAILY_SEP_EXPECTED,
             id="daily-sep",
         ),
     ],
 )
-def test_seq_range(args: dict, expected: str, capsys: pytest.CaptureFixture[str]):
-    parser = argparse.ArgumentParser()
-    args.setdefault("daily", False)
-    args.setdefault("weekly", None)
-    args.setdefault("monthly", None)
-    args.setdefault("yearly", None)
-    args.setdefault("exclude", [])
-    args.setdefault("exclude_start", False)
-    args.setdefault("exclude_end", False)
-    args.setdefault("sep", "\n")
-    args = argparse.Namespace(**args)
-    seq_range_action(parser, args)
-    captured = capsys.readouterr()
-    assert captured.out == expected + "\n"
+def test_seq_range(
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+):
+    ns = argparse.Namespace(**{**SEQ_RANGE_DEFAULTS, **args})
+    assert _seq_range_compute(parser, ns) == expected
 
 
 @pytest.mark.parametrize(
@@ -301,14 +339,12 @@ def test_seq_range(args: dict, expected: str, capsys: pytest.CaptureFixture[str]
                 "date": date(2016, 10, 4),
                 "before": 2,
             },
-            "\n".join(
-                f"2016{m:02d}{d:02d}" for m, d in [(9, 28), (10, 1), (10, 5), (10, 8)]
-            ),
+            SEQ_BRACKET_WEEKLY_2_EXPECTED,
             id="weekly-2",
         ),
         pytest.param(
             {"monthly": [14], "date": date(2017, 7, 14), "before": 2, "after": 1},
-            "\n".join(f"2017{m:02d}14" for m in [5, 6, 8]),
+            SEQ_BRACKET_MONTHLY_2_1_EXPECTED,
             id="monthly-2-1",
         ),
         pytest.param(
@@ -319,10 +355,7 @@ def test_seq_range(args: dict, expected: str, capsys: pytest.CaptureFixture[str]
                 "after": 2,
                 "inclusive": True,
             },
-            "\n".join(
-                f"{y:04d}{m:02d}{d:02d}"
-                for y, m, d in [(2019, 2, 2), (2019, 3, 3), (2019, 4, 4), (2020, 1, 1)]
-            ),
+            SEQ_BRACKET_YEARLY_1_2_INC_EXPECTED,
             id="yearly-1-2-inc",
         ),
         pytest.param(
@@ -332,18 +365,62 @@ def test_seq_range(args: dict, expected: str, capsys: pytest.CaptureFixture[str]
         ),
     ],
 )
-def test_seq_bracket(args: dict, expected: str, capsys: pytest.CaptureFixture[str]):
-    parser = argparse.ArgumentParser()
-    args.setdefault("daily", False)
-    args.setdefault("weekly", None)
-    args.setdefault("monthly", None)
-    args.setdefault("yearly", None)
-    args.setdefault("exclude", [])
-    args.setdefault("before", 1)
-    args.setdefault("after", None)
-    args.setdefault("inclusive", False)
-    args.setdefault("sep", "\n")
-    args = argparse.Namespace(**args)
-    seq_bracket_action(parser, args)
+def test_seq_bracket(
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+):
+    ns = argparse.Namespace(**{**SEQ_BRACKET_DEFAULTS, **args})
+    assert _seq_bracket_compute(parser, ns) == expected
+
+
+@pytest.mark.parametrize(
+    "action, args, expected",
+    [
+        pytest.param(
+            seq_next_action,
+            {**SEQ_NEXT_DEFAULTS, "daily": True, "date": date(1999, 12, 31)},
+            "20000101",
+            id="next",
+        ),
+        pytest.param(
+            seq_prev_action,
+            {**SEQ_NEXT_DEFAULTS, "monthly": [5, 20], "date": date(2007, 4, 10)},
+            "20070405",
+            id="prev",
+        ),
+        pytest.param(
+            seq_nearest_action,
+            {**SEQ_NEAREST_DEFAULTS, "monthly": [1, 15], "date": date(1995, 8, 25)},
+            "19950901",
+            id="nearest",
+        ),
+        pytest.param(
+            seq_range_action,
+            {
+                **SEQ_RANGE_DEFAULTS,
+                "daily": True,
+                "from": date(2008, 3, 12),
+                "to": date(2008, 3, 20),
+            },
+            SEQ_RANGE_DAILY_EXPECTED,
+            id="range",
+        ),
+        pytest.param(
+            seq_bracket_action,
+            {**SEQ_BRACKET_DEFAULTS, "daily": True, "date": date(2015, 3, 26)},
+            "20150325\n20150327",
+            id="bracket",
+        ),
+    ],
+)
+def test_seq_action_output(
+    action: Callable[[argparse.ArgumentParser, argparse.Namespace], None],
+    args: dict,
+    expected: str,
+    parser: argparse.ArgumentParser,
+    capsys: pytest.CaptureFixture[str],
+):
+    action(parser, argparse.Namespace(**args))
     captured = capsys.readouterr()
     assert captured.out == expected + "\n"
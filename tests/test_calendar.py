@@ -14,6 +14,53 @@ from earthkit.time.calendar import (
     to_weekday,
 )
 
+_MONTH_LENGTH_CASES = [
+    (2000, 1, 31),
+    (2001, 2, 28),
+    (2002, 3, 31),
+    (2003, 4, 30),
+    (2004, 5, 31),
+    (2005, 6, 30),
+    (2006, 7, 31),
+    (2007, 8, 31),
+    (2008, 9, 30),
+    (2009, 10, 31),
+    (2010, 11, 30),
+    (2011, 12, 31),
+    (2012, 2, 29),
+    (2013, 13, "^Invalid month: 13$"),
+]
+
+_MONTHINYEAR_LENGTH_CASES = [
+    (1993, 1, 31),
+    (1994, 2, 28),
+    (1996, 2, 29),
+    (1995, 3, 31),
+    (1997, 4, 30),
+    (1998, 5, 31),
+    (1999, 6, 30),
+    (2000, 7, 31),
+    (2001, 8, 31),
+    (2002, 9, 30),
+    (2003, 10, 31),
+    (2004, 11, 30),
+    (2005, 12, 31),
+]
+
+_MONTHINYEAR_NEXT_CASES = [
+    (1954, 3, 1954, 4),
+    (2020, 12, 2021, 1),
+    (2005, 1, 2005, 2),
+    (1976, 11, 1976, 12),
+]
+
+_MONTHINYEAR_PREVIOUS_CASES = [
+    (2050, 6, 2050, 5),
+    (1972, 1, 1971, 12),
+    (1999, 2, 1999, 1),
+    (2013, 12, 2013, 11),
+]
+
 
 @pytest.mark.parametrize(
     "arg, expected",
@@ -41,25 +88,7 @@ def test_to_weekday(arg: Union[int, str], expected: Union[Weekday, str]):
         assert to_weekday(arg) == expected
 
 
-@pytest.mark.parametrize(
-    "year, month, expected",
-    [
-        (2000, 1, 31),
-        (2001, 2, 28),
-        (2002, 3, 31),
-        (2003, 4, 30),
-        (2004, 5, 31),
-        (2005, 6, 30),
-        (2006, 7, 31),
-        (2007, 8, 31),
-        (2008, 9, 30),
-        (2009, 10, 31),
-        (2010, 11, 30),
-        (2011, 12, 31),
-        (2012, 2, 29),
-        (2013, 13, "^Invalid month: 13$"),
-    ],
-)
+@pytest.mark.parametrize("year, month, expected", _MONTH_LENGTH_CASES)
 def test_month_length(year: int, month: int, expected: Union[int, str]):
     context = nullcontext()
     if isinstance(expected, str):
@@ -120,33 +149,13 @@ def test_monthinyear_contains(
     assert (day in ymonth) == expected
 
 
-@pytest.mark.parametrize(
-    "year, month, expected",
-    [
-        (1993, 1, 31),
-        (1994, 2, 28),
-        (1996, 2, 29),
-        (1995, 3, 31),
-        (1997, 4, 30),
-        (1998, 5, 31),
-        (1999, 6, 30),
-        (2000, 7, 31),
-        (2001, 8, 31),
-        (2002, 9, 30),
-        (2003, 10, 31),
-        (2004, 11, 30),
-        (2005, 12, 31),
-    ],
-)
+@pytest.mark.parametrize("year, month, expected", _MONTHINYEAR_LENGTH_CASES)
 def test_monthinyear_length(year: int, month: int, expected: int):
     ymonth = MonthInYear(year, month)
     assert ymonth.length() == expected
 
 
-@pytest.mark.parametrize(
-    "year, month, eyear, emonth",
-    [(1954, 3, 1954, 4), (2020, 12, 2021, 1), (2005, 1, 2005, 2), (1976, 11, 1976, 12)],
-)
+@pytest.mark.parametrize("year, month, eyear, emonth", _MONTHINYEAR_NEXT_CASES)
 def test_monthinyear_next(year: int, month: int, eyear: int, emonth: int):
     ymonth = MonthInYear(year, month)
     next_ymonth = ymonth.next()
@@ -154,10 +163,7 @@ def test_monthinyear_next(year: int, month: int, eyear: int, emonth: int):
     assert next_ymonth.month == emonth
 
 
-@pytest.mark.parametrize(
-    "year, month, eyear, emonth",
-    [(2050, 6, 2050, 5), (1972, 1, 1971, 12), (1999, 2, 1999, 1), (2013, 12, 2013, 11)],
-)
+@pytest.mark.parametrize("year, month, eyear, emonth", _MONTHINYEAR_PREVIOUS_CASES)
 def test_monthinyear_previous(year: int, month: int, eyear: int, emonth: int):
     ymonth = MonthInYear(year, month)
     prev_ymonth = ymonth.previous()
@@ -197,6 +203,8 @@ def test_parse_mmdd(
         pytest.param("202005", None, id="yearmonthonly"),
         pytest.param("20202503", None, id="notadate"),
         pytest.param("20201204", (2020, 12, 4), id="ok"),
+        pytest.param("20230229", None, id="nonleap"),
+        pytest.param("00000101", None, id="yearzero"),
         pytest.param("202010251200", None, id="toolong"),
         pytest.param((2022,), "^not enough values to unpack", id="tup-inclomplete"),
         pytest.param((2022, 2, 3), (2022, 2, 3), id="tup-ok"),
@@ -1,4 +1,5 @@
 from datetime import date, timedelta
+from typing import List, Union
 
 import pytest
 
@@ -7,101 +8,104 @@ from earthkit.time.calendar import MONDAY, THURSDAY
 from earthkit.time.climatology import RelativeYear
 from earthkit.time.sequence import MonthlySequence, WeeklySequence
 
-
-def test_date_range_leapyear():
-    # reference is leap
-    assert list(date_range(date(2020, 2, 29), 2018, 2020)) == [
-        date(2018, 2, 28),
-        date(2019, 2, 28),
-        date(2020, 2, 28),
-    ]
-
-    # reference is leap (2)
-    assert list(date_range(date(2020, 2, 29), date(2017, 2, 28), date(2019, 3, 1))) == [
+_LEAP_CASES = [
+    pytest.param(
+        date(2020, 2, 29),
+        2018,
+        2020,
+        [date(2018, 2, 28), date(2019, 2, 28), date(2020, 2, 28)],
+        id="reference-leap",
+    ),
+    pytest.param(
+        date(2020, 2, 29),
         date(2017, 2, 28),
-        date(2018, 2, 28),
-        date(2019, 2, 28),
-    ]
-
-    # start is leap (1)
-    assert list(date_range(date(2022, 3, 1), date(2020, 2, 29), date(2023, 3, 1))) == [
-        date(2020, 3, 1),
-        date(2021, 3, 1),
+        date(2019, 3, 1),
+        [date(2017, 2, 28), date(2018, 2, 28), date(2019, 2, 28)],
+        id="reference-leap-2",
+    ),
+    pytest.param(
         date(2022, 3, 1),
+        date(2020, 2, 29),
         date(2023, 3, 1),
-    ]
-
-    # start is leap (2)
-    assert list(date_range(date(2022, 2, 28), date(2020, 2, 29), date(2023, 3, 1))) == [
-        date(2021, 2, 28),
+        [date(2020, 3, 1), date(2021, 3, 1), date(2022, 3, 1), date(2023, 3, 1)],
+        id="start-leap",
+    ),
+    pytest.param(
         date(2022, 2, 28),
-        date(2023, 2, 28),
-    ]
-
-    # end is leap (1)
-    assert list(date_range(date(2022, 3, 1), date(2020, 2, 28), date(2024, 2, 29))) == [
-        date(2020, 3, 1),
-        date(2021, 3, 1),
-        date(2022, 3, 1),
+        date(2020, 2, 29),
         date(2023, 3, 1),
-    ]
-
-    # end is leap (2)
-    assert list(
-        date_range(date(2022, 2, 28), date(2020, 2, 28), date(2024, 2, 29))
-    ) == [
+        [date(2021, 2, 28), date(2022, 2, 28), date(2023, 2, 28)],
+        id="start-leap-2",
+    ),
+    pytest.param(
+        date(2022, 3, 1),
         date(2020, 2, 28),
-        date(2021, 2, 28),
+        date(2024, 2, 29),
+        [date(2020, 3, 1), date(2021, 3, 1), date(2022, 3, 1), date(2023, 3, 1)],
+        id="end-leap",
+    ),
+    pytest.param(
         date(2022, 2, 28),
-        date(2023, 2, 28),
-        date(2024, 2, 28),
-    ]
-
-    # start and end are leap (1)
-    assert list(date_range(date(2022, 3, 1), date(2020, 2, 29), date(2024, 2, 29))) == [
-        date(2020, 3, 1),
-        date(2021, 3, 1),
+        date(2020, 2, 28),
+        date(2024, 2, 29),
+        [
+            date(2020, 2, 28),
+            date(2021, 2, 28),
+            date(2022, 2, 28),
+            date(2023, 2, 28),
+            date(2024, 2, 28),
+        ],
+        id="end-leap-2",
+    ),
+    pytest.param(
         date(2022, 3, 1),
-        date(2023, 3, 1),
-    ]
-
-    # start and end are leap (2)
-    assert list(
-        date_range(date(2022, 2, 28), date(2020, 2, 29), date(2024, 2, 29))
-    ) == [
-        date(2021, 2, 28),
+        date(2020, 2, 29),
+        date(2024, 2, 29),
+        [date(2020, 3, 1), date(2021, 3, 1), date(2022, 3, 1), date(2023, 3, 1)],
+        id="start-end-leap",
+    ),
+    pytest.param(
         date(2022, 2, 28),
-        date(2023, 2, 28),
-        date(2024, 2, 28),
-    ]
-
-    # reference and start are leap
-    assert list(date_range(date(2020, 2, 29), date(2016, 2, 29), date(2019, 3, 1))) == [
-        date(2017, 2, 28),
-        date(2018, 2, 28),
-        date(2019, 2, 28),
-    ]
-
-    # reference and end are leap
-    assert list(
-        date_range(date(2020, 2, 29), date(2017, 2, 28), date(2020, 2, 29))
-    ) == [
-        date(2017, 2, 28),
-        date(2018, 2, 28),
-        date(2019, 2, 28),
-        date(2020, 2, 28),
-    ]
-
-    # all dates are leap
-    assert list(
-        date_range(date(2020, 2, 29), date(2016, 2, 29), date(2020, 2, 29))
-    ) == [
+        date(2020, 2, 29),
+        date(2024, 2, 29),
+        [date(2021, 2, 28), date(2022, 2, 28), date(2023, 2, 28), date(2024, 2, 28)],
+        id="start-end-leap-2",
+    ),
+    pytest.param(
+        date(2020, 2, 29),
+        date(2016, 2, 29),
+        date(2019, 3, 1),
+        [date(2017, 2, 28), date(2018, 2, 28), date(2019, 2, 28)],
+        id="reference-start-leap",
+    ),
+    pytest.param(
+        date(2020, 2, 29),
         date(2017, 2, 28),
-        date(2018, 2, 28),
-        date(2019, 2, 28),
-        date(2020, 2, 28),
-    ]
-
+        date(2020, 2, 29),
+        [date(2017, 2, 28), date(2018, 2, 28), date(2019, 2, 28), date(2020, 2, 28)],
+        id="reference-end-leap",
+    ),
+    pytest.param(
+        date(2020, 2, 29),
+        date(2016, 2, 29),
+        date(2020, 2, 29),
+        [date(2017, 2, 28), date(2018, 2, 28), date(2019, 2, 28), date(2020, 2, 28)],
+        id="all-leap",
+    ),
+]
+
+
+@pytest.mark.parametrize("ref, start, end, expected", _LEAP_CASES)
+def test_date_range_leapyear(
+    ref: date,
+    start: Union[date, int],
+    end: Union[date, int],
+    expected: List[date],
+):
+    assert list(date_range(ref, start, end)) == expected
+
+
+def test_date_range_unknown_recurrence():
     with pytest.raises(ValueError, match="^Unknown recurrence"):
         list(date_range(date(2021, 1, 2), 2000, 2004, "sesquiannually"))
 
@@ -1,152 +1,208 @@
 import os
+import pathlib
+from typing import List, Optional
 
 import pytest
 
 from earthkit.time.data import ResourceType, find_resource
 
 
-def test_find_resource(
-    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
-):
-    # Packaged resources only
-    assert find_resource("sequences/ecmwf-mon-thu.yaml")[0] == ResourceType.PACKAGED
-    assert find_resource("sequences/nonexistent")[0] == ResourceType.NOTFOUND
-
-    custom = tmp_path_factory.mktemp("custom")
-    custom_foo = custom / "foo.txt"
-    custom_foo.write_text("Hello!")
-    custom_seq = custom / "ecmwf-mon-thu.yaml"
-    custom_seq.write_text("type: weekly\ndays: [0, 3]\n")
-
-    # Resource by path
-    assert find_resource("sequences/test-hello", path=str(custom_foo)) == (
-        ResourceType.FILE,
-        str(custom_foo),
-    )
-
-    # Path overrides packaged
-    assert find_resource("sequences/ecmwf-mon-thu.yaml", path=str(custom_foo)) == (
-        ResourceType.FILE,
-        str(custom_foo),
-    )
-
-    # Non-existent path does not override
-    assert (
-        find_resource(
-            "sequences/ecmwf-mon-thu.yaml", path=str(custom / "nonexistent.txt")
-        )[0]
-        == ResourceType.PACKAGED
-    )
-
-    # Resource by env file
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_FILE", str(custom_foo))
-        assert find_resource("sequences/test-hello", env_file="TEST_RES_FILE") == (
+@pytest.fixture
+def resource_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    custom = tmp_path / "custom"
+    custom.mkdir()
+    (custom / "foo.txt").write_text("Hello!")
+    (custom / "ecmwf-mon-thu.yaml").write_text("type: weekly\ndays: [0, 3]\n")
+
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "foo.txt").write_text("Hi there!")
+    (other / "bar.txt").write_text("Testing")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "name, path, env_file, env_path, expected_type, expected_path",
+    [
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            None,
+            None,
+            None,
+            ResourceType.PACKAGED,
+            None,
+            id="packaged",
+        ),
+        pytest.param(
+            "sequences/nonexistent",
+            None,
+            None,
+            None,
+            ResourceType.NOTFOUND,
+            None,
+            id="packaged-nonexistent",
+        ),
+        pytest.param(
+            "sequences/test-hello",
+            "custom/foo.txt",
+            None,
+            None,
             ResourceType.FILE,
-            str(custom_foo),
-        )
-
-    # Non-existent env file
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_FILE", str(custom / "nonexistent.txt"))
-        assert (
-            find_resource("sequences/test-hello", env_file="TEST_RES_FILE")[0]
-            == ResourceType.NOTFOUND
-        )
-
-    # Env file overrides packaged
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_FILE", str(custom_seq))
-        assert find_resource(
-            "sequences/ecmwf-mon-thu.yaml", env_file="TEST_RES_FILE"
-        ) == (
+            "custom/foo.txt",
+            id="path",
+        ),
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            "custom/foo.txt",
+            None,
+            None,
             ResourceType.FILE,
-            str(custom_seq),
-        )
-
-    # Non-existent env file does not override
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_FILE", str(custom / "nonexistent.txt"))
-        assert (
-            find_resource("sequences/ecmwf-mon-thu.yaml", env_file="TEST_RES_FILE")[0]
-            == ResourceType.PACKAGED
-        )
-
-    other = tmp_path_factory.mktemp("other")
-    other_foo = other / "foo.txt"
-    other_foo.write_text("Hi there!")
-    other_bar = other / "bar.txt"
-    other_bar.write_text("Testing")
-
-    # Path overrides env file
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_FILE", str(custom_foo))
-        assert find_resource(
-            "sequences/test-hello", path=str(other_foo), env_file="TEST_RES_FILE"
-        ) == (
+            "custom/foo.txt",
+            id="path-overrides-packaged",
+        ),
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            "custom/nonexistent.txt",
+            None,
+            None,
+            ResourceType.PACKAGED,
+            None,
+            id="path-nonexistent-no-override",
+        ),
+        pytest.param(
+            "sequences/test-hello",
+            None,
+            "custom/foo.txt",
+            None,
             ResourceType.FILE,
-            str(other_foo),
-        )
-
-    # Resource by env path, with precedence
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(other), str(custom)]))
-        assert find_resource("sequences/foo.txt", env_path="TEST_RES_DIR") == (
+            "custom/foo.txt",
+            id="env-file",
+        ),
+        pytest.param(
+            "sequences/test-hello",
+            None,
+            "custom/nonexistent.txt",
+            None,
+            ResourceType.NOTFOUND,
+            None,
+            id="env-file-nonexistent",
+        ),
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            None,
+            "custom/ecmwf-mon-thu.yaml",
+            None,
             ResourceType.FILE,
-            str(other_foo),
-        )
-
-    # Resource by env path, not present in first dir
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(custom), str(other)]))
-        assert find_resource("sequences/bar.txt", env_path="TEST_RES_DIR") == (
+            "custom/ecmwf-mon-thu.yaml",
+            id="env-file-overrides-packaged",
+        ),
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            None,
+            "custom/nonexistent.txt",
+            None,
+            ResourceType.PACKAGED,
+            None,
+            id="env-file-nonexistent-no-override",
+        ),
+        pytest.param(
+            "sequences/test-hello",
+            "other/foo.txt",
+            "custom/foo.txt",
+            None,
             ResourceType.FILE,
-            str(other_bar),
-        )
-
-    # Resource by env path, non-existent
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(custom), str(other)]))
-        assert (
-            find_resource("sequences/nonexistent", env_path="TEST_RES_DIR")[0]
-            == ResourceType.NOTFOUND
-        )
-
-    # Env path overrides packaged
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(other), str(custom)]))
-        assert find_resource(
-            "sequences/ecmwf-mon-thu.yaml", env_path="TEST_RES_DIR"
-        ) == (
+            "other/foo.txt",
+            id="path-overrides-env-file",
+        ),
+        pytest.param(
+            "sequences/foo.txt",
+            None,
+            None,
+            ["other", "custom"],
             ResourceType.FILE,
-            str(custom_seq),
-        )
-
-    # Non-existent env path does not override
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(other / "nonexistent")]))
-        assert (
-            find_resource("sequences/ecmwf-mon-thu.yaml", env_path="TEST_RES_DIR")[0]
-            == ResourceType.PACKAGED
-        )
-
-    # Env file overrides env path
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_FILE", str(other_bar))
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(other), str(custom)]))
-        assert find_resource(
-            "sequences/foo.txt", env_file="TEST_RES_FILE", env_path="TEST_RES_DIR"
-        ) == (
+            "other/foo.txt",
+            id="env-path-precedence",
+        ),
+        pytest.param(
+            "sequences/bar.txt",
+            None,
+            None,
+            ["custom", "other"],
             ResourceType.FILE,
-            str(other_bar),
-        )
-
-    # Path overrides env path
-    with monkeypatch.context() as m:
-        m.setenv("TEST_RES_DIR", os.pathsep.join([str(other), str(custom)]))
-        assert find_resource(
-            "sequences/foo.txt", path=str(other_bar), env_path="TEST_RES_DIR"
-        ) == (
+            "other/bar.txt",
+            id="env-path-not-in-first",
+        ),
+        pytest.param(
+            "sequences/nonexistent",
+            None,
+            None,
+            ["custom", "other"],
+            ResourceType.NOTFOUND,
+            None,
+            id="env-path-nonexistent",
+        ),
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            None,
+            None,
+            ["other", "custom"],
+            ResourceType.FILE,
+            "custom/ecmwf-mon-thu.yaml",
+            id="env-path-overrides-packaged",
+        ),
+        pytest.param(
+            "sequences/ecmwf-mon-thu.yaml",
+            None,
+            None,
+            ["other/nonexistent"],
+            ResourceType.PACKAGED,
+            None,
+            id="env-path-nonexistent-no-override",
+        ),
+        pytest.param(
+            "sequences/foo.txt",
+            None,
+            "other/bar.txt",
+            ["other", "custom"],
             ResourceType.FILE,
-            str(other_bar),
+            "other/bar.txt",
+            id="env-file-overrides-env-path",
+        ),
+        pytest.param(
+            "sequences/foo.txt",
+            "other/bar.txt",
+            None,
+            ["other", "custom"],
+            ResourceType.FILE,
+            "other/bar.txt",
+            id="path-overrides-env-path",
+        ),
+    ],
+)
+def test_find_resource(
+    monkeypatch: pytest.MonkeyPatch,
+    resource_dir: pathlib.Path,
+    name: str,
+    path: Optional[str],
+    env_file: Optional[str],
+    env_path: Optional[List[str]],
+    expected_type: ResourceType,
+    expected_path: Optional[str],
+):
+    kwargs = {}
+    if path is not None:
+        kwargs["path"] = str(resource_dir / path)
+    if env_file is not None:
+        monkeypatch.setenv("TEST_RES_FILE", str(resource_dir / env_file))
+        kwargs["env_file"] = "TEST_RES_FILE"
+    if env_path is not None:
+        monkeypatch.setenv(
+            "TEST_RES_DIR", os.pathsep.join(str(resource_dir / d) for d in env_path)
         )
+        kwargs["env_path"] = "TEST_RES_DIR"
+
+    res_type, res_path = find_resource(name, **kwargs)
+    assert res_type == expected_type
+    if expected_path is not None:
+        assert res_path == str(resource_dir / expected_path)
@@ -1,11 +1,13 @@
 import bisect
 import calendar
+import itertools
+import json
 import os
+import pathlib
 from datetime import date
-from typing import List, Optional, Tuple, Type
+from typing import Container, Dict, Iterable, List, Optional, Tuple, Type
 
 import pytest
-import yaml
 
 from earthkit.time.calendar import (
     FRIDAY,
@@ -24,6 +26,29 @@ from earthkit.time.sequence import (
     YearlySequence,
 )
 
+_DATE_CACHE: Dict[Tuple[int, int, int], date] = {}
+
+
+def D(year: int, month: int, day: int) -> date:
+    """Return a shared date object for the given year, month and day"""
+    key = (year, month, day)
+    if key not in _DATE_CACHE:
+        _DATE_CACHE[key] = date(year, month, day)
+    return _DATE_CACHE[key]
+
+
+_MISSING = object()
+
+
+def assert_iter_equal(it: Iterable, expected: Iterable):
+    """Compare an iterable to the expected items without building a list"""
+    for i, (item, exp) in enumerate(
+        itertools.zip_longest(it, expected, fillvalue=_MISSING)
+    ):
+        assert item is not _MISSING, f"Missing item at position {i}: {exp!r}"
+        assert exp is not _MISSING, f"Unexpected item at position {i}: {item!r}"
+        assert item == exp, f"Mismatch at position {i}: {item!r} != {exp!r}"
+
 
 class ExcludeLeapFeb28:
     def __contains__(self, day: date) -> bool:
@@ -39,219 +64,333 @@ class ExcludeNonTenYears:
         return day.year % 10 != 0
 
 
+EXCLUDE_LEAP_FEB28 = ExcludeLeapFeb28()
+EXCLUDE_NON_TEN_YEARS = ExcludeNonTenYears()
+
+
 @pytest.mark.parametrize(
-    "seq, ymds, outside",
+    "seq, dates, outside",
     [
         pytest.param(
             DailySequence(),
-            [(1983, 4, 28), (1983, 4, 29), (1983, 4, 30), (1983, 5, 1), (1983, 5, 2)],
+            [
+                D(1983, 4, 28),
+                D(1983, 4, 29),
+                D(1983, 4, 30),
+                D(1983, 5, 1),
+                D(1983, 5, 2),
+            ],
             [],
             id="daily-simple",
         ),
         pytest.param(
             DailySequence(),
             [
-                (2001, 12, 29),
-                (2001, 12, 30),
-                (2001, 12, 31),
-                (2002, 1, 1),
-                (2002, 1, 2),
+                D(2001, 12, 29),
+                D(2001, 12, 30),
+                D(2001, 12, 31),
+                D(2002, 1, 1),
+                D(2002, 1, 2),
             ],
             [],
             id="daily-crossyear",
         ),
         pytest.param(
             DailySequence(),
-            [(2003, 2, 26), (2003, 2, 27), (2003, 2, 28), (2003, 3, 1), (2003, 3, 2)],
+            [
+                D(2003, 2, 26),
+                D(2003, 2, 27),
+                D(2003, 2, 28),
+                D(2003, 3, 1),
+                D(2003, 3, 2),
+            ],
             [],
             id="daily-feb28-nonleap",
         ),
         pytest.param(
             DailySequence(),
-            [(2016, 2, 27), (2016, 2, 28), (2016, 2, 29), (2016, 3, 1), (2016, 3, 2)],
+            [
+                D(2016, 2, 27),
+                D(2016, 2, 28),
+                D(2016, 2, 29),
+                D(2016, 3, 1),
+                D(2016, 3, 2),
+            ],
             [],
             id="daily-feb28-leap",
         ),
         pytest.param(
             DailySequence(excludes=[1]),
-            [(1995, 4, 28), (1995, 4, 29), (1995, 4, 30), (1995, 5, 2), (1995, 5, 3)],
-            [(1995, 5, 1)],
+            [
+                D(1995, 4, 28),
+                D(1995, 4, 29),
+                D(1995, 4, 30),
+                D(1995, 5, 2),
+                D(1995, 5, 3),
+            ],
+            [D(1995, 5, 1)],
             id="daily-exclude",
         ),
         pytest.param(
             DailySequence(excludes=[29]),
-            [(2000, 2, 26), (2000, 2, 27), (2000, 2, 28), (2000, 3, 1), (2000, 3, 2)],
-            [(2000, 2, 29)],
+            [
+                D(2000, 2, 26),
+                D(2000, 2, 27),
+                D(2000, 2, 28),
+                D(2000, 3, 1),
+                D(2000, 3, 2),
+            ],
+            [D(2000, 2, 29)],
             id="daily-exclude-leap",
         ),
         pytest.param(
             DailySequence(excludes=range(1, 29)),
-            [(2020, 1, 30), (2020, 1, 31), (2020, 2, 29), (2020, 3, 29), (2020, 3, 30)],
-            [(2020, 2, 20)],
+            [
+                D(2020, 1, 30),
+                D(2020, 1, 31),
+                D(2020, 2, 29),
+                D(2020, 3, 29),
+                D(2020, 3, 30),
+            ],
+            [D(2020, 2, 20)],
             id="daily-exclude-almostall",
         ),
         pytest.param(
             WeeklySequence(2),
-            [(1999, 3, 24), (1999, 3, 31), (1999, 4, 7), (1999, 4, 14), (1999, 4, 21)],
-            [(1999, 4, 20)],
+            [
+                D(1999, 3, 24),
+                D(1999, 3, 31),
+                D(1999, 4, 7),
+                D(1999, 4, 14),
+                D(1999, 4, 21),
+            ],
+            [D(1999, 4, 20)],
             id="weekly-simple",
         ),
         pytest.param(
             WeeklySequence(FRIDAY),
             [
-                (2011, 12, 23),
-                (2011, 12, 30),
-                (2012, 1, 6),
-                (2012, 1, 13),
-                (2012, 1, 20),
+                D(2011, 12, 23),
+                D(2011, 12, 30),
+                D(2012, 1, 6),
+                D(2012, 1, 13),
+                D(2012, 1, 20),
             ],
-            [(2012, 1, 2)],
+            [D(2012, 1, 2)],
             id="weekly-crossyear",
         ),
         pytest.param(
             WeeklySequence([2, 5]),
-            [(2007, 2, 24), (2007, 2, 28), (2007, 3, 3), (2007, 3, 7), (2007, 3, 10)],
-            [(2007, 2, 25), (2007, 3, 5)],
+            [
+                D(2007, 2, 24),
+                D(2007, 2, 28),
+                D(2007, 3, 3),
+                D(2007, 3, 7),
+                D(2007, 3, 10),
+            ],
+            [D(2007, 2, 25), D(2007, 3, 5)],
             id="weekly-feb28-nonleap",
         ),
         pytest.param(
             WeeklySequence([MONDAY, THURSDAY]),
-            [(2024, 2, 22), (2024, 2, 26), (2024, 2, 29), (2024, 3, 4), (2024, 3, 7)],
-            [(2024, 2, 28), (2024, 3, 2)],
+            [
+                D(2024, 2, 22),
+                D(2024, 2, 26),
+                D(2024, 2, 29),
+                D(2024, 3, 4),
+                D(2024, 3, 7),
+            ],
+            [D(2024, 2, 28), D(2024, 3, 2)],
             id="weekly-feb28-leap",
         ),
         pytest.param(
             MonthlySequence(15),
-            [(1989, 3, 15), (1989, 4, 15), (1989, 5, 15), (1989, 6, 15), (1989, 7, 15)],
-            [(1989, 4, 30), (1989, 5, 19)],
+            [
+                D(1989, 3, 15),
+                D(1989, 4, 15),
+                D(1989, 5, 15),
+                D(1989, 6, 15),
+                D(1989, 7, 15),
+            ],
+            [D(1989, 4, 30), D(1989, 5, 19)],
             id="monthly-simple",
         ),
         pytest.param(
             MonthlySequence([7, 21]),
             [
-                (2014, 11, 21),
-                (2014, 12, 7),
-                (2014, 12, 21),
-                (2015, 1, 7),
-                (2015, 1, 21),
+                D(2014, 11, 21),
+                D(2014, 12, 7),
+                D(2014, 12, 21),
+                D(2015, 1, 7),
+                D(2015, 1, 21),
             ],
-            [(2014, 12, 14), (2014, 12, 31)],
+            [D(2014, 12, 14), D(2014, 12, 31)],
             id="monthly-crossyear",
         ),
         pytest.param(
             MonthlySequence(range(1, 32, 7)),
-            [(2009, 2, 15), (2009, 2, 22), (2009, 3, 1), (2009, 3, 8), (2009, 3, 15)],
-            [(2009, 3, 14)],
+            [
+                D(2009, 2, 15),
+                D(2009, 2, 22),
+                D(2009, 3, 1),
+                D(2009, 3, 8),
+                D(2009, 3, 15),
+            ],
+            [D(2009, 3, 14)],
             id="monthly-feb28-nonleap",
         ),
         pytest.param(
             MonthlySequence([28, 29]),
-            [(1992, 1, 29), (1992, 2, 28), (1992, 2, 29), (1992, 3, 28), (1992, 3, 29)],
-            [(1992, 2, 18), (1992, 3, 14)],
+            [
+                D(1992, 1, 29),
+                D(1992, 2, 28),
+                D(1992, 2, 29),
+                D(1992, 3, 28),
+                D(1992, 3, 29),
+            ],
+            [D(1992, 2, 18), D(1992, 3, 14)],
             id="monthly-feb28-leap",
         ),
         pytest.param(
             MonthlySequence([11, 22], excludes=[(11, 11)]),
             [
-                (1987, 10, 11),
-                (1987, 10, 22),
-                (1987, 11, 22),
-                (1987, 12, 11),
-                (1987, 12, 22),
+                D(1987, 10, 11),
+                D(1987, 10, 22),
+                D(1987, 11, 22),
+                D(1987, 12, 11),
+                D(1987, 12, 22),
             ],
-            [(1987, 11, 11)],
+            [D(1987, 11, 11)],
             id="monthly-exclude",
         ),
         pytest.param(
             MonthlySequence([27, 29, 31], excludes=[(2, 29)]),
-            [(2008, 1, 31), (2008, 2, 27), (2008, 3, 27), (2008, 3, 29), (2008, 3, 31)],
-            [(2008, 2, 29), (2008, 3, 28)],
+            [
+                D(2008, 1, 31),
+                D(2008, 2, 27),
+                D(2008, 3, 27),
+                D(2008, 3, 29),
+                D(2008, 3, 31),
+            ],
+            [D(2008, 2, 29), D(2008, 3, 28)],
             id="monthly-exclude-leap",
         ),
         pytest.param(
             MonthlySequence(31, excludes=[(i, 31) for i in range(1, 10)]),
             [
-                (2021, 10, 31),
-                (2021, 12, 31),
-                (2022, 10, 31),
-                (2022, 12, 31),
-                (2023, 10, 31),
+                D(2021, 10, 31),
+                D(2021, 12, 31),
+                D(2022, 10, 31),
+                D(2022, 12, 31),
+                D(2023, 10, 31),
             ],
-            [(2022, 5, 9), (2022, 6, 1)],
+            [D(2022, 5, 9), D(2022, 6, 1)],
             id="monthly-exclude-almostall",
         ),
         pytest.param(
             YearlySequence((1, 1)),
-            [(1999, 1, 1), (2000, 1, 1), (2001, 1, 1), (2002, 1, 1), (2003, 1, 1)],
-            [(2000, 7, 2), (2002, 2, 2)],
+            [D(1999, 1, 1), D(2000, 1, 1), D(2001, 1, 1), D(2002, 1, 1), D(2003, 1, 1)],
+            [D(2000, 7, 2), D(2002, 2, 2)],
             id="yearly-simple",
         ),
         pytest.param(
             YearlySequence([(1, 1), (4, 2), (7, 2), (10, 1)]),
             [
-                (2017, 7, 2),
-                (2017, 10, 1),
-                (2018, 1, 1),
-                (2018, 4, 2),
-                (2018, 7, 2),
+                D(2017, 7, 2),
+                D(2017, 10, 1),
+                D(2018, 1, 1),
+                D(2018, 4, 2),
+                D(2018, 7, 2),
             ],
-            [(2017, 11, 16), (2018, 6, 18)],
+            [D(2017, 11, 16), D(2018, 6, 18)],
             id="yearly-crossyear",
         ),
         pytest.param(
             YearlySequence([(2, 28), (2, 29), (3, 1)]),
-            [(1994, 2, 28), (1994, 3, 1), (1995, 2, 28), (1995, 3, 1), (1996, 2, 28)],
-            [(1994, 8, 30), (1995, 2, 22)],
+            [
+                D(1994, 2, 28),
+                D(1994, 3, 1),
+                D(1995, 2, 28),
+                D(1995, 3, 1),
+                D(1996, 2, 28),
+            ],
+            [D(1994, 8, 30), D(1995, 2, 22)],
             id="yearly-feb28-nonleap",
         ),
         pytest.param(
             YearlySequence([(i, 29) for i in range(1, 13)]),
-            [(2008, 1, 29), (2008, 2, 29), (2008, 3, 29), (2008, 4, 29), (2008, 5, 29)],
-            [(2008, 2, 28), (2008, 5, 14)],
+            [
+                D(2008, 1, 29),
+                D(2008, 2, 29),
+                D(2008, 3, 29),
+                D(2008, 4, 29),
+                D(2008, 5, 29),
+            ],
+            [D(2008, 2, 28), D(2008, 5, 14)],
             id="yearly-feb28-leap",
         ),
         pytest.param(
             YearlySequence((2, 29)),
-            [(2000, 2, 29), (2004, 2, 29), (2008, 2, 29), (2012, 2, 29), (2016, 2, 29)],
-            [(2003, 2, 28)],
+            [
+                D(2000, 2, 29),
+                D(2004, 2, 29),
+                D(2008, 2, 29),
+                D(2012, 2, 29),
+                D(2016, 2, 29),
+            ],
+            [D(2003, 2, 28)],
             id="yearly-leaponly",
         ),
         pytest.param(
-            YearlySequence([(7, 13)], excludes=[date(2023, 7, 13)]),
-            [(2020, 7, 13), (2021, 7, 13), (2022, 7, 13), (2024, 7, 13), (2025, 7, 13)],
-            [(2023, 7, 13)],
+            YearlySequence([(7, 13)], excludes=[D(2023, 7, 13)]),
+            [
+                D(2020, 7, 13),
+                D(2021, 7, 13),
+                D(2022, 7, 13),
+                D(2024, 7, 13),
+                D(2025, 7, 13),
+            ],
+            [D(2023, 7, 13)],
             id="yearly-exclude",
         ),
         pytest.param(
-            YearlySequence([(1, 31), (2, 28), (2, 29)], excludes=ExcludeLeapFeb28()),
-            [(2007, 1, 31), (2007, 2, 28), (2008, 1, 31), (2008, 2, 29), (2009, 1, 31)],
-            [(2007, 2, 14), (2008, 3, 10)],
+            YearlySequence([(1, 31), (2, 28), (2, 29)], excludes=EXCLUDE_LEAP_FEB28),
+            [
+                D(2007, 1, 31),
+                D(2007, 2, 28),
+                D(2008, 1, 31),
+                D(2008, 2, 29),
+                D(2009, 1, 31),
+            ],
+            [D(2007, 2, 14), D(2008, 3, 10)],
             id="yearly-exclude-leap",
         ),
         pytest.param(
-            YearlySequence([(3, 31)], excludes=ExcludeNonTenYears()),  # FIXME
-            [(1990, 3, 31), (2000, 3, 31), (2010, 3, 31), (2020, 3, 31), (2030, 3, 31)],
-            [(2001, 3, 31), (2005, 3, 31)],
+            YearlySequence([(3, 31)], excludes=EXCLUDE_NON_TEN_YEARS),  # FIXME
+            [
+                D(1990, 3, 31),
+                D(2000, 3, 31),
+                D(2010, 3, 31),
+                D(2020, 3, 31),
+                D(2030, 3, 31),
+            ],
+            [D(2001, 3, 31), D(2005, 3, 31)],
             id="yearly-exclude-almostall",
         ),
     ],
 )
 def test_sequence(
     seq: Sequence,
-    ymds: List[Tuple[int, int, int]],
-    outside: List[Tuple[int, int, int]],
+    dates: List[date],
+    outside: List[date],
 ):
-    dates = [date(y, m, d) for y, m, d in ymds]
-
     for d in dates:
         assert d in seq
 
-    for i in range(1, len(dates) - 1):
-        prev = dates[i - 1]
-        cur = dates[i]
-        next = dates[i + 1]
-
-        assert seq.next(cur) == next
+    full = list(seq.range(dates[0], dates[-1]))
+    assert full == dates
+    for prev, cur, nxt in zip(dates, dates[1:], dates[2:]):
+        assert seq.next(cur) == nxt
         assert seq.next(cur, False) == cur
         assert seq.previous(cur) == prev
         assert seq.previous(cur, False) == cur
@@ -259,13 +398,13 @@ def test_sequence(
         assert seq.nearest(cur, resolve="previous") == cur
         assert seq.nearest(cur, resolve="next") == cur
 
-    assert list(seq.range(dates[0], dates[-1])) == dates
-    assert list(seq.range(dates[0], dates[-1], include_start=False)) == dates[1:]
-    assert (
-        list(seq.range(dates[0], dates[-1], include_start=False, include_end=False))
-        == dates[1:-1]
+    # The flags only drop the endpoints, the rest must match the full range
+    assert_iter_equal(seq.range(dates[0], dates[-1], include_start=False), full[1:])
+    assert_iter_equal(
+        seq.range(dates[0], dates[-1], include_start=False, include_end=False),
+        full[1:-1],
     )
-    assert list(seq.range(dates[0], dates[-1], include_end=False)) == dates[:-1]
+    assert_iter_equal(seq.range(dates[0], dates[-1], include_end=False), full[:-1])
 
     assert list(seq.bracket(dates[2])) == [dates[1], dates[3]]
     assert list(seq.bracket(dates[2], 2)) == [dates[0], dates[1], dates[3], dates[4]]
@@ -273,9 +412,10 @@ def test_sequence(
     assert list(seq.bracket(dates[2], 1, strict=False)) == dates[1:4]
     assert list(seq.bracket(dates[2], (2, 1), strict=False)) == dates[:4]
 
-    for out_tup in outside:
-        out_date = date(*out_tup)
-        out_i = bisect.bisect_left(dates, out_date)
+    ords = [d.toordinal() for d in dates]
+    for out_date in outside:
+        out_ord = out_date.toordinal()
+        out_i = bisect.bisect_left(ords, out_ord)
         before = out_i
         after = len(dates) - out_i
 
@@ -283,8 +423,8 @@ def test_sequence(
         assert seq.next(out_date) == dates[out_i]
         assert seq.previous(out_date) == dates[out_i - 1]
 
-        db = (out_date - dates[out_i - 1]).days
-        da = (dates[out_i] - out_date).days
+        db = out_ord - ords[out_i - 1]
+        da = ords[out_i] - out_ord
         if db != da:
             exp_nearest = dates[out_i - 1] if db < da else dates[out_i]
             assert seq.nearest(out_date) == exp_nearest
@@ -293,12 +433,14 @@ def test_sequence(
             assert seq.nearest(out_date, resolve="previous") == dates[out_i - 1]
             assert seq.nearest(out_date, resolve="next") == dates[out_i]
 
-        assert list(seq.range(out_date, dates[-1])) == dates[out_i:]
-        assert (
-            list(seq.range(out_date, dates[-1], include_start=False)) == dates[out_i:]
+        assert_iter_equal(seq.range(out_date, dates[-1]), dates[out_i:])
+        assert_iter_equal(
+            seq.range(out_date, dates[-1], include_start=False), dates[out_i:]
+        )
+        assert_iter_equal(seq.range(dates[0], out_date), dates[:out_i])
+        assert_iter_equal(
+            seq.range(dates[0], out_date, include_end=False), dates[:out_i]
         )
-        assert list(seq.range(dates[0], out_date)) == dates[:out_i]
-        assert list(seq.range(dates[0], out_date, include_end=False)) == dates[:out_i]
 
         assert list(seq.bracket(out_date)) == [dates[out_i - 1], dates[out_i]]
         assert list(seq.bracket(out_date, (before, after))) == dates
@@ -312,6 +454,127 @@ def test_sequence(
         )
 
 
+@pytest.mark.parametrize(
+    "seq, excludes, inside, outside, ref, expect_next",
+    [
+        pytest.param(
+            DailySequence(excludes={5}),
+            {7},
+            D(2020, 1, 5),
+            D(2020, 1, 7),
+            D(2020, 1, 6),
+            D(2020, 1, 8),
+            id="daily",
+        ),
+        pytest.param(
+            MonthlySequence([5, 7], excludes=[(1, 5)]),
+            [(1, 7)],
+            D(2020, 1, 5),
+            D(2020, 1, 7),
+            D(2020, 1, 5),
+            D(2020, 2, 5),
+            id="monthly",
+        ),
+        pytest.param(
+            YearlySequence([(1, 5), (1, 7)], excludes={D(2020, 1, 5)}),
+            {D(2020, 1, 7)},
+            D(2020, 1, 5),
+            D(2020, 1, 7),
+            D(2020, 1, 5),
+            D(2021, 1, 5),
+            id="yearly",
+        ),
+    ],
+)
+def test_sequence_set_excludes(
+    seq: Sequence,
+    excludes: Container,
+    inside: date,
+    outside: date,
+    ref: date,
+    expect_next: date,
+):
+    # Query first, so that any cached state is populated
+    assert outside in seq
+    seq.next(ref)
+
+    seq.excludes = excludes
+    assert seq.excludes is excludes
+    assert inside in seq
+    assert outside not in seq
+    assert seq.next(ref) == expect_next
+
+
+@pytest.mark.parametrize(
+    "seq, days, expect_days, inside, outside, ref, expect_next, expect_prev",
+    [
+        pytest.param(
+            WeeklySequence(MONDAY),
+            [FRIDAY, WEDNESDAY],
+            [WEDNESDAY, FRIDAY],
+            D(2024, 1, 3),
+            D(2024, 1, 1),
+            D(2024, 1, 1),
+            D(2024, 1, 3),
+            D(2023, 12, 29),
+            id="weekly",
+        ),
+        pytest.param(
+            MonthlySequence([1, 15]),
+            [20, 3],
+            [3, 20],
+            D(2020, 1, 3),
+            D(2020, 1, 15),
+            D(2020, 1, 15),
+            D(2020, 1, 20),
+            D(2020, 1, 3),
+            id="monthly",
+        ),
+        pytest.param(
+            YearlySequence([(1, 5)]),
+            [(3, 1), (1, 7)],
+            [(1, 7), (3, 1)],
+            D(2020, 1, 7),
+            D(2020, 1, 5),
+            D(2020, 1, 5),
+            D(2020, 1, 7),
+            D(2019, 3, 1),
+            id="yearly",
+        ),
+    ],
+)
+def test_sequence_set_days(
+    seq: Sequence,
+    days: list,
+    expect_days: list,
+    inside: date,
+    outside: date,
+    ref: date,
+    expect_next: date,
+    expect_prev: date,
+):
+    # Query first, so that any cached state is populated
+    assert outside in seq
+    seq.next(ref)
+
+    seq.days = days
+    assert seq.days == expect_days
+    assert inside in seq
+    assert outside not in seq
+    assert seq.next(ref) == expect_next
+    assert seq.previous(ref) == expect_prev
+
+
+def test_yearly_sequence_cache_size():
+    seq = YearlySequence([(1, 1), (7, 1)])
+    dates = list(seq.range(date(1700, 1, 1), date(2100, 12, 31)))
+    assert len(dates) == 2 * 401
+    assert dates[0] == date(1700, 1, 1)
+    assert dates[-1] == date(2100, 7, 1)
+    assert len(seq._year_cache) <= YearlySequence._YEAR_CACHE_SIZE
+    assert seq.previous(date(1700, 1, 2)) == date(1700, 1, 1)
+
+
 @pytest.mark.parametrize(
     "seq_dict, expect_type, expect_days, expect_excludes",
     [
@@ -470,41 +733,45 @@ def test_create_sequence_invalid(seq_dict: dict, expect_msg: str):
         Sequence.from_dict(seq_dict)
 
 
-def test_sequence_from_resource(
-    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
-):
-    seq = Sequence.from_resource("ecmwf-mon-thu")
-    assert type(seq) is WeeklySequence
-    assert seq.days == [MONDAY, THURSDAY]
+_ECMWF_4DAYS = [
+    (m, d) for m in range(1, 13) for d in range(1, month_length(1999, m) + 1, 4)
+]
 
-    with pytest.raises(FileNotFoundError):
-        Sequence.from_resource("invalid-sequence")
 
+@pytest.fixture(scope="session")
+def seq_paths(tmp_path_factory: pytest.TempPathFactory) -> List[pathlib.Path]:
     seq_path1 = tmp_path_factory.mktemp("seqs1")
-    (seq_path1 / "wednesdays.yaml").write_text(
-        yaml.safe_dump({"type": "weekly", "days": ["Wednesday"]})
-    )
-    (seq_path1 / "foo.yaml").write_text(
-        yaml.safe_dump({"type": "monthly", "days": [2, 4, 6, 8]})
-    )
+    (seq_path1 / "wednesdays.yaml").write_text("type: weekly\ndays: [Wednesday]\n")
+    (seq_path1 / "foo.yaml").write_text("type: monthly\ndays: [2, 4, 6, 8]\n")
 
     seq_path2 = tmp_path_factory.mktemp("seqs2")
-    (seq_path2 / "foo.yaml").write_text(yaml.safe_dump({"type": "daily"}))
+    (seq_path2 / "foo.yaml").write_text("type: daily\n")
     (seq_path2 / "ecmwf-4days.yaml").write_text(
-        yaml.safe_dump(
-            {
-                "type": "yearly",
-                "days": [
-                    (m, d)
-                    for m in range(1, 13)
-                    for d in range(1, month_length(1999, m) + 1, 4)
-                ],
-            }
-        )
+        json.dumps({"type": "yearly", "days": _ECMWF_4DAYS})
     )
 
+    return [seq_path1, seq_path2]
+
+
+@pytest.fixture(scope="session")
+def ecmwf_mon_thu() -> Sequence:
+    return Sequence.from_resource("ecmwf-mon-thu")
+
+
+def test_sequence_from_resource(
+    monkeypatch: pytest.MonkeyPatch,
+    seq_paths: List[pathlib.Path],
+    ecmwf_mon_thu: Sequence,
+):
+    seq = ecmwf_mon_thu
+    assert type(seq) is WeeklySequence
+    assert seq.days == [MONDAY, THURSDAY]
+
+    with pytest.raises(FileNotFoundError):
+        Sequence.from_resource("invalid-sequence")
+
     envname = "EARTHKIT_TIME_SEQ_PATH"
-    monkeypatch.setenv(envname, os.pathsep.join([str(seq_path1), str(seq_path2)]))
+    monkeypatch.setenv(envname, os.pathsep.join(str(path) for path in seq_paths))
 
     print(os.getenv(envname))
 
@@ -518,3 +785,4 @@ def test_sequence_from_resource(
 
     seq = Sequence.from_resource("ecmwf-4days")
     assert type(seq) is YearlySequence
+    assert seq.days == _ECMWF_4DAYS
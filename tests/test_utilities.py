@@ -1,3 +1,5 @@
+import itertools
+
 from earthkit.time.utilities import merge_sorted
 
 
@@ -5,6 +7,15 @@ def test_merge_sorted():
     assert list(merge_sorted([])) == []
     assert list(merge_sorted([range(5)])) == list(range(5))
     assert list(merge_sorted([range(3), range(4, 7)])) == [0, 1, 2, 4, 5, 6]
+    assert list(merge_sorted([[], [], [1, 2]])) == [1, 2]
     assert list(merge_sorted((range(n, 10, 2) for n in range(2)))) == list(range(10))
     assert list(merge_sorted((range(n, 10, 3) for n in range(3)))) == list(range(10))
     assert list(merge_sorted((range(n, 10, 4) for n in range(4)))) == list(range(10))
+
+
+def test_merge_sorted_large():
+    its = [range(0), range(0)]
+    its += [range(n, 100000, 3 + n) for n in range(12)]
+    its += [range(0), [50000], range(99990, 100010)]
+    expected = sorted(itertools.chain.from_iterable(its))
+    assert list(merge_sorted(its)) == expected